@@ -1,20 +1,153 @@
+from typing import List
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
+    QHeaderView,
     QMainWindow,
     QMessageBox,
-    QTableWidgetItem,
-    QPushButton,
-    QHBoxLayout,
-    QWidget,
+    QStyledItemDelegate,
     QAbstractItemView,
 )
 
 from session_manager import WindowManager
-from student import student_manager
+from student import Student, student_manager
 
 from ui_app import Ui_AppWindow
 
 
+class StudentsTableModel(QAbstractTableModel):
+    """Table model exposing students to a QTableView
+
+    Holds the student list as plain data; only currently visible cells
+    are queried through data(), so population cost no longer scales with
+    per-cell item allocations.
+    """
+
+    HEADERS = ["ID", "Tên", "Ngày Sinh", "Quê Quán", "Giao Xứ", "Giáo Phận", "Thao tác"]
+    ACTION_COLUMN = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[tuple] = []
+
+    def set_students(self, students: List[Student]):
+        """Replace the model contents in a single reset"""
+        self.beginResetModel()
+        # Cell texts are extracted once per reset and shared by every
+        # repaint, instead of re-reading model attributes in data()
+        self._rows = [
+            (s.id, s.name, s.birth_date, s.hometown, s.parish, s.diocese)
+            for s in students
+        ]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        # The view probes many roles per visible cell; reject everything
+        # but DisplayRole before touching the index at all
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+
+        column = index.column()
+        if column == self.ACTION_COLUMN:
+            return None
+
+        return self._rows[index.row()][column]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Paints flat Edit/Delete buttons in the action column
+
+    Drawing the buttons instead of embedding real QPushButtons avoids
+    creating a widget container per row; clicks are dispatched from
+    editorEvent() based on the x-coordinate.
+    """
+
+    edit_clicked = Signal(str)
+    delete_clicked = Signal(str)
+
+    BUTTON_WIDTH = 50
+    BUTTON_HEIGHT = 22
+    SPACING = 5
+
+    # Shared brushes/pens - paint() runs for every visible row on every
+    # repaint, so the colors are built once instead of per call
+    EDIT_COLOR = QColor("#007bff")
+    DELETE_COLOR = QColor("#dc3545")
+    TEXT_COLOR = QColor("white")
+
+    def _button_rects(self, rect: QRect):
+        """Compute the Edit and Delete button rects inside a cell rect"""
+        y = rect.top() + (rect.height() - self.BUTTON_HEIGHT) // 2
+        edit_rect = QRect(
+            rect.left() + self.SPACING, y, self.BUTTON_WIDTH, self.BUTTON_HEIGHT
+        )
+        delete_rect = QRect(
+            edit_rect.right() + self.SPACING, y, self.BUTTON_WIDTH, self.BUTTON_HEIGHT
+        )
+        return edit_rect, delete_rect
+
+    def paint(self, painter, option, index):
+        edit_rect, delete_rect = self._button_rects(option.rect)
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setPen(Qt.NoPen)
+
+        painter.setBrush(self.EDIT_COLOR)
+        painter.drawRoundedRect(edit_rect, 3, 3)
+        painter.setBrush(self.DELETE_COLOR)
+        painter.drawRoundedRect(delete_rect, 3, 3)
+
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(edit_rect, Qt.AlignCenter, "Sửa")
+        painter.drawText(delete_rect, Qt.AlignCenter, "Xóa")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease:
+            student_id = index.siblingAtColumn(0).data()
+            if student_id:
+                edit_rect, delete_rect = self._button_rects(option.rect)
+                pos = event.position().toPoint()
+
+                if edit_rect.contains(pos):
+                    self.edit_clicked.emit(student_id)
+                    return True
+                if delete_rect.contains(pos):
+                    self.delete_clicked.emit(student_id)
+                    return True
+
+        return super().editorEvent(event, model, option, index)
+
+
 class AppWindow(QMainWindow):
+    STUDENTS_TAB_INDEX = 0
+
     def __init__(self, user_email: str, parent=None):
         super().__init__(parent)
         self.user_email = user_email
@@ -37,12 +170,18 @@ class AppWindow(QMainWindow):
         self.ui.addStudentButton.clicked.connect(self.add_student)
         self.ui.studentSearchEdit.textChanged.connect(self.search_students)
 
-        # Setup students table
+        # Setup students table - data is loaded lazily on first tab visit
         self.setup_students_table()
-        self.load_students_data()
+        self._loaded_tabs = set()
+        self.ui.tabWidget.currentChanged.connect(self._load_tab_data)
 
-        # Connect student manager signals
-        student_manager.students_changed.connect(self.load_students_data)
+        # Connect student manager signals - bursts of students_changed are
+        # coalesced into a single reload per event-loop turn
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(0)
+        self._reload_timer.timeout.connect(self.load_students_data)
+        student_manager.students_changed.connect(self._reload_timer.start)
 
         # Set status bar message
         self.ui.statusbar.showMessage("Sẵn sàng - Seminary Management System")
@@ -66,6 +205,20 @@ class AppWindow(QMainWindow):
             "© 2025 Seminary Management Team",
         )
 
+    def _load_tab_data(self, index: int):
+        """Load a tab's data on its first visit"""
+        if index in self._loaded_tabs:
+            return
+        self._loaded_tabs.add(index)
+
+        if index == self.STUDENTS_TAB_INDEX:
+            self.load_students_data()
+
+    def showEvent(self, event):
+        """Populate the initially visible tab on first show"""
+        super().showEvent(event)
+        self._load_tab_data(self.ui.tabWidget.currentIndex())
+
     # Tab switching methods
     def switch_to_dashboard(self):
         """Switch to Dashboard tab"""
@@ -76,7 +229,6 @@ class AppWindow(QMainWindow):
         """Switch to Students tab"""
         self.ui.tabWidget.setCurrentIndex(0)  # Student tab is index 0
         self.ui.statusbar.showMessage("Students - Quản lý sinh viên")
-        self.refresh_students()
 
     def switch_to_courses(self):
         """Switch to Courses tab"""
@@ -95,213 +247,145 @@ class AppWindow(QMainWindow):
 
     # Student Management Methods
     def setup_students_table(self):
-        """Setup students table widget"""
-        table = self.ui.studentTableWidget
+        """Setup students table view with its model and delegate"""
+        view = self.ui.studentTableView
+
+        self.students_model = StudentsTableModel(self)
+
+        # Search filters through a proxy instead of rebuilding the table
+        self.search_proxy = QSortFilterProxyModel(self)
+        self.search_proxy.setSourceModel(self.students_model)
+        self.search_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.search_proxy.setFilterKeyColumn(-1)  # Match any column
+        view.setModel(self.search_proxy)
+
+        # Edit/Delete actions are painted by the delegate - no per-row widgets
+        self.action_delegate = ActionButtonDelegate(self)
+        self.action_delegate.edit_clicked.connect(self.edit_student)
+        self.action_delegate.delete_clicked.connect(self.delete_student)
+        view.setItemDelegateForColumn(
+            StudentsTableModel.ACTION_COLUMN, self.action_delegate
+        )
 
         # Set column widths
-        table.setColumnWidth(0, 80)  # ID
-        table.setColumnWidth(1, 200)  # Tên
-        table.setColumnWidth(2, 120)  # Ngày Sinh
-        table.setColumnWidth(3, 150)  # Quê Quán
-        table.setColumnWidth(4, 200)  # Giao Xứ
-        table.setColumnWidth(5, 150)  # Giáo Phận
-        table.setColumnWidth(6, 150)  # Thao tác
+        view.setColumnWidth(0, 80)  # ID
+        view.setColumnWidth(1, 200)  # Tên
+        view.setColumnWidth(2, 120)  # Ngày Sinh
+        view.setColumnWidth(3, 150)  # Quê Quán
+        view.setColumnWidth(4, 200)  # Giao Xứ
+        view.setColumnWidth(5, 150)  # Giáo Phận
+        view.setColumnWidth(6, 150)  # Thao tác
+
+        # The explicit widths above are final - fixed section modes keep the
+        # view from measuring cell contents to recompute sizes
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         # Set table properties
-        table.setSortingEnabled(True)
-        table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        view.setSortingEnabled(True)
+        view.setAlternatingRowColors(True)
+        view.setSelectionBehavior(QAbstractItemView.SelectRows)
+
+        # The view only renders visible cells; a uniform row height keeps
+        # scrollbar geometry exact without measuring off-screen rows
+        view.verticalHeader().setDefaultSectionSize(32)
+        view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+    def _set_table_students(self, students: List[Student]):
+        """Populate the table in one batch without intermediate repaints"""
+        view = self.ui.studentTableView
+        view.setUpdatesEnabled(False)
+        view.setSortingEnabled(False)
+        try:
+            self.students_model.set_students(students)
+        finally:
+            view.setSortingEnabled(True)
+            view.setUpdatesEnabled(True)
 
     def load_students_data(self):
         """Load students data into table"""
-        try:
-            students = student_manager.get_all_students()
-            table = self.ui.studentTableWidget
-
-            # Clear existing data
-            table.setRowCount(0)
-
-            # Add students to table
-            for row, student in enumerate(students):
-                table.insertRow(row)
-
-                # Add data to columns
-                table.setItem(row, 0, QTableWidgetItem(student.id))
-                table.setItem(row, 1, QTableWidgetItem(student.name))
-                table.setItem(row, 2, QTableWidgetItem(student.birth_date))
-                table.setItem(row, 3, QTableWidgetItem(student.hometown))
-                table.setItem(row, 4, QTableWidgetItem(student.parish))
-                table.setItem(row, 5, QTableWidgetItem(student.diocese))
-
-                # Add action buttons
-                self.add_action_buttons(row, student.id)
-
-            # Update status
-            total_students = len(students)
-            self.ui.statusbar.showMessage(f"Đã tải {total_students} sinh viên")
-
-        except Exception as e:
-            QMessageBox.critical(
-                self, "Lỗi", f"Không thể tải dữ liệu sinh viên: {str(e)}"
-            )
+        students = student_manager.get_all_students()
+        self._set_table_students(students)
 
-    def add_action_buttons(self, row: int, student_id: str):
-        """Add action buttons (Edit/Delete) to table row"""
-        # Create widget container
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 2, 5, 2)
-        layout.setSpacing(5)
-
-        # Edit button
-        edit_btn = QPushButton("Sửa")
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                padding: 4px 8px;
-                border-radius: 3px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
-        edit_btn.clicked.connect(lambda: self.edit_student(student_id))
-
-        # Delete button
-        delete_btn = QPushButton("Xóa")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                padding: 4px 8px;
-                border-radius: 3px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
-        delete_btn.clicked.connect(lambda: self.delete_student(student_id))
-
-        layout.addWidget(edit_btn)
-        layout.addWidget(delete_btn)
-        layout.addStretch()
-
-        self.ui.studentTableWidget.setCellWidget(row, 6, widget)
+        # Update status
+        self.ui.statusbar.showMessage(f"Đã tải {len(students)} sinh viên")
 
     def refresh_students(self):
         """Refresh students data"""
         student_manager.load_data()
         self.load_students_data()
         self.ui.studentSearchEdit.clear()
-        QMessageBox.information(self, "Thành công", "Đã làm mới dữ liệu sinh viên")
+        self.ui.statusbar.showMessage("Đã làm mới dữ liệu sinh viên")
 
     def search_students(self, query: str):
         """Search students based on query"""
-        try:
-            if not query.strip():
-                # Show all students if search is empty
-                self.load_students_data()
-                return
-
-            # Get filtered students
-            filtered_students = student_manager.search_students(query)
-            table = self.ui.studentTableWidget
-
-            # Clear existing data
-            table.setRowCount(0)
-
-            # Add filtered students to table
-            for row, student in enumerate(filtered_students):
-                table.insertRow(row)
-
-                table.setItem(row, 0, QTableWidgetItem(student.id))
-                table.setItem(row, 1, QTableWidgetItem(student.name))
-                table.setItem(row, 2, QTableWidgetItem(student.birth_date))
-                table.setItem(row, 3, QTableWidgetItem(student.hometown))
-                table.setItem(row, 4, QTableWidgetItem(student.parish))
-                table.setItem(row, 5, QTableWidgetItem(student.diocese))
-
-                self.add_action_buttons(row, student.id)
+        query = query.strip()
+        self.search_proxy.setFilterFixedString(query)
 
-            # Update status
+        # Update status
+        if query:
             self.ui.statusbar.showMessage(
-                f"Tìm thấy {len(filtered_students)} sinh viên"
+                f"Tìm thấy {self.search_proxy.rowCount()} sinh viên"
+            )
+        else:
+            self.ui.statusbar.showMessage(
+                f"Đã tải {self.students_model.rowCount()} sinh viên"
             )
-
-        except Exception as e:
-            QMessageBox.critical(self, "Lỗi", f"Lỗi tìm kiếm: {str(e)}")
 
     def add_student(self):
         """Add new student"""
-        try:
-            # For now, show a simple input dialog
-            # TODO: Create a proper add student dialog
-            QMessageBox.information(
-                self,
-                "Thêm Sinh Viên",
-                "Tính năng thêm sinh viên mới sẽ được triển khai trong phiên bản tiếp theo.\n\n"
-                "Hiện tại bạn có thể xem dữ liệu mẫu trong bảng.",
-            )
-
-        except Exception as e:
-            QMessageBox.critical(self, "Lỗi", f"Lỗi khi thêm sinh viên: {str(e)}")
+        # For now, show a simple input dialog
+        # TODO: Create a proper add student dialog
+        QMessageBox.information(
+            self,
+            "Thêm Sinh Viên",
+            "Tính năng thêm sinh viên mới sẽ được triển khai trong phiên bản tiếp theo.\n\n"
+            "Hiện tại bạn có thể xem dữ liệu mẫu trong bảng.",
+        )
 
     def edit_student(self, student_id: str):
         """Edit student"""
-        try:
-            student = student_manager.get_student_by_id(student_id)
-            if not student:
-                QMessageBox.warning(self, "Cảnh báo", "Không tìm thấy sinh viên")
-                return
-
-            # For now, show student info
-            # TODO: Create a proper edit student dialog
-            info = (
-                f"Thông tin sinh viên:\n\n"
-                f"ID: {student.id}\n"
-                f"Tên: {student.name}\n"
-                f"Ngày sinh: {student.birth_date}\n"
-                f"Tuổi: {student.get_age()}\n"
-                f"Quê quán: {student.hometown}\n"
-                f"Giao xứ: {student.parish}\n"
-                f"Giáo phận: {student.diocese}"
-            )
-
-            QMessageBox.information(self, "Thông tin Sinh Viên", info)
+        student = student_manager.get_student_by_id(student_id)
+        if not student:
+            QMessageBox.warning(self, "Cảnh báo", "Không tìm thấy sinh viên")
+            return
+
+        # For now, show student info
+        # TODO: Create a proper edit student dialog
+        info = (
+            f"Thông tin sinh viên:\n\n"
+            f"ID: {student.id}\n"
+            f"Tên: {student.name}\n"
+            f"Ngày sinh: {student.birth_date}\n"
+            f"Tuổi: {student.get_age()}\n"
+            f"Quê quán: {student.hometown}\n"
+            f"Giao xứ: {student.parish}\n"
+            f"Giáo phận: {student.diocese}"
+        )
 
-        except Exception as e:
-            QMessageBox.critical(self, "Lỗi", f"Lỗi khi chỉnh sửa sinh viên: {str(e)}")
+        QMessageBox.information(self, "Thông tin Sinh Viên", info)
 
     def delete_student(self, student_id: str):
         """Delete student"""
-        try:
-            student = student_manager.get_student_by_id(student_id)
-            if not student:
-                QMessageBox.warning(self, "Cảnh báo", "Không tìm thấy sinh viên")
-                return
-
-            # Confirm deletion
-            reply = QMessageBox.question(
-                self,
-                "Xác nhận xóa",
-                f"Bạn có chắc chắn muốn xóa sinh viên '{student.name}' (ID: {student.id})?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No,
-            )
+        student = student_manager.get_student_by_id(student_id)
+        if not student:
+            QMessageBox.warning(self, "Cảnh báo", "Không tìm thấy sinh viên")
+            return
+
+        # Confirm deletion
+        reply = QMessageBox.question(
+            self,
+            "Xác nhận xóa",
+            f"Bạn có chắc chắn muốn xóa sinh viên '{student.name}' (ID: {student.id})?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No,
+        )
 
-            if reply == QMessageBox.Yes:
-                if student_manager.delete_student(student_id):
-                    QMessageBox.information(
-                        self, "Thành công", "Đã xóa sinh viên thành công"
-                    )
-                    self.load_students_data()
-                else:
-                    QMessageBox.critical(self, "Lỗi", "Không thể xóa sinh viên")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Lỗi", f"Lỗi khi xóa sinh viên: {str(e)}")
+        if reply == QMessageBox.Yes:
+            if student_manager.delete_student(student_id):
+                QMessageBox.information(
+                    self, "Thành công", "Đã xóa sinh viên thành công"
+                )
+                self.load_students_data()
+            else:
+                QMessageBox.critical(self, "Lỗi", "Không thể xóa sinh viên")
@@ -0,0 +1,26 @@
+"""
+JSON Utilities Module
+Shared (de)serialization helpers for Seminary Management System
+"""
+
+import json
+
+try:
+    # Optional fast JSON backend (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Deserialize JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize to a compact JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
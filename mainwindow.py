@@ -1,17 +1,24 @@
+import hashlib
+import hmac
 import os
 import re
 import sys
 
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPainter, QPainterPath, QPixmap, QIcon
+from PySide6.QtGui import (
+    QIcon,
+    QImage,
+    QKeySequence,
+    QPainter,
+    QPixmap,
+    QShortcut,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
     QMessageBox,
 )
 
-from app import AppWindow
-from dashboard import DashboardWindow
 from session_manager import SessionManager, WindowManager
 
 # Important:
@@ -20,8 +27,28 @@ from session_manager import SessionManager, WindowManager
 #     pyside2-uic form.ui -o ui_form.py
 from ui_form import Ui_MainWindow
 
+# Asset paths resolved once at import - the files never move at runtime
+IMAGES_DIR = os.path.join(os.path.dirname(__file__), "images")
+LOGO_PNG_PATH = os.path.join(IMAGES_DIR, "logo.png")
+APP_ICON_PATH = os.path.join(IMAGES_DIR, "logo.ico")
+
+# Email validation pattern, compiled once at import instead of per window
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+EMAIL_REGEX = re.compile(EMAIL_PATTERN)
+
+# Demo credentials stored as SHA-256 digests, built once at import so the
+# login path only hashes the attempt and compares digests
+VALID_USERS = {
+    "admin@seminary.edu": hashlib.sha256(b"admin123").hexdigest(),
+    "user@seminary.edu": hashlib.sha256(b"user123").hexdigest(),
+}
+
 
 class MainWindow(QMainWindow):
+    # Rendered circular logo raster, shared across instances - logout/login
+    # recreates the window but the logo never changes
+    _circular_logo_image = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.ui = Ui_MainWindow()
@@ -33,64 +60,80 @@ class MainWindow(QMainWindow):
         # Setup circular logo
         self.setup_circular_logo()
 
-        # Setup validation
-        self.setup_validation()
-
         # Kết nối signals
         self.ui.submitButton.clicked.connect(self.handle_login)
         self.ui.forgotPasswordLink.mousePressEvent = self.handle_forgot_password
 
-        # Enable Enter key để submit
-        self.ui.passwordInput.returnPressed.connect(self.handle_login)
-        self.ui.emailInput.returnPressed.connect(self.handle_login)
+        # Enable Enter key để submit - one window-level shortcut instead of
+        # a returnPressed connection per input
+        for key in (Qt.Key_Return, Qt.Key_Enter):
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.activated.connect(self.handle_login)
 
     def setup_window_icon(self):
         """Setup window icon using logo.ico"""
         WindowManager.setup_window_icon(self)
 
     def setup_circular_logo(self):
-        """Create a circular logo from the logo image"""
-        if hasattr(self.ui, "companyLogo"):
-            # Load the logo image
-            logo_path = os.path.join(os.path.dirname(__file__), "images", "logo.png")
-
-            if os.path.exists(logo_path):
-                # Load and scale the original image
-                original_pixmap = QPixmap(logo_path)
-                size = 36
-
-                # Create a circular mask
-                circular_pixmap = QPixmap(size, size)
-                circular_pixmap.fill(Qt.transparent)
-
-                painter = QPainter(circular_pixmap)
-                painter.setRenderHint(QPainter.Antialiasing)
-
-                # Create circular path
-                path = QPainterPath()
-                path.addEllipse(0, 0, size, size)
-                painter.setClipPath(path)
-
-                # Scale and draw the original image
-                scaled_pixmap = original_pixmap.scaled(
-                    size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-                x = (size - scaled_pixmap.width()) // 2
-                y = (size - scaled_pixmap.height()) // 2
-                painter.drawPixmap(x, y, scaled_pixmap)
-                painter.end()
-
-                # Set the circular logo
-                self.ui.companyLogo.setPixmap(circular_pixmap)
-                self.ui.companyLogo.setAlignment(Qt.AlignCenter)
-
-    def setup_validation(self):
-        # Email validation pattern
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        self.email_regex = re.compile(email_pattern)
+        """Set the circular logo, rendering it only on first use"""
+        if not hasattr(self.ui, "companyLogo"):
+            return
+
+        if MainWindow._circular_logo_image is None:
+            MainWindow._circular_logo_image = self.render_circular_logo()
+
+        if MainWindow._circular_logo_image is not None:
+            # Blit the cached raster into a pixmap only when it goes on screen
+            self.ui.companyLogo.setPixmap(
+                QPixmap.fromImage(MainWindow._circular_logo_image)
+            )
+            self.ui.companyLogo.setAlignment(Qt.AlignCenter)
+
+    @staticmethod
+    def render_circular_logo():
+        """Render the circular logo into a raster image (CPU-only work)"""
+        if not os.path.exists(LOGO_PNG_PATH):
+            return None
+
+        # Load the original image
+        original_image = QImage(LOGO_PNG_PATH)
+        size = 36
+
+        # Paint into a plain raster image, not a screen-bound pixmap
+        circular_image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        circular_image.fill(Qt.transparent)
+
+        painter = QPainter(circular_image)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Scale and draw the original image first...
+        scaled_image = original_image.scaled(
+            size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+        x = (size - scaled_image.width()) // 2
+        y = (size - scaled_image.height()) // 2
+        painter.drawImage(x, y, scaled_image)
+
+        # ...then keep only the pixels inside an anti-aliased circle.
+        # DestinationIn multiplies the existing alpha by the brush alpha,
+        # giving a smoother rim than path clipping
+        painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(Qt.white)
+        painter.drawEllipse(0, 0, size, size)
+        painter.end()
+
+        return circular_image
 
     def validate_email(self, email: str) -> bool:
-        return bool(self.email_regex.match(email))
+        # Quick rejects before running the regex: plausible length, a
+        # non-leading '@' and a dot somewhere after it
+        if not 6 <= len(email) <= 254:
+            return False
+        at = email.find("@")
+        if at <= 0 or "." not in email[at + 1 :]:
+            return False
+        return bool(EMAIL_REGEX.match(email))
 
     def handle_login(self):
         # Disable button để tránh double-click
@@ -100,7 +143,9 @@ class MainWindow(QMainWindow):
         try:
             # Lấy và validate input
             email = self.ui.emailInput.text().strip()
-            password = self.ui.passwordInput.text().strip()
+            # Passwords are taken verbatim - stripping would silently
+            # reject credentials with meaningful whitespace
+            password = self.ui.passwordInput.text()
 
             # Validation
             if not email:
@@ -140,11 +185,12 @@ class MainWindow(QMainWindow):
     def authenticate_user(self, email: str, password: str) -> bool:
         # TODO: Thay thế bằng logic authentication thực tế
         # Ví dụ: database query, API call, etc.
+        expected = VALID_USERS.get(email)
+        if expected is None:
+            return False
 
-        # Demo data
-        valid_users = {"admin@seminary.edu": "admin123", "user@seminary.edu": "user123"}
-
-        return valid_users.get(email) == password
+        attempt = hashlib.sha256(password.encode("utf-8")).hexdigest()
+        return hmac.compare_digest(attempt, expected)
 
     def show_error(self, message: str):
         QMessageBox.warning(self, "Lỗi", message)
@@ -179,14 +225,12 @@ class MainWindow(QMainWindow):
 
     def open_main_application(self, user_email: str):
         """Mở cửa sổ chính của ứng dụng"""
-        try:
-            # Tạo và hiển thị cửa sổ chính
-            self.main_window = AppWindow(user_email)
-            self.main_window.show()
+        # Import ở đây để màn hình login hiển thị không phải chờ import app
+        from app import AppWindow
 
-        except ImportError:
-            self.dashboard_window = DashboardWindow(user_email)
-            self.dashboard_window.show()
+        # Tạo và hiển thị cửa sổ chính
+        self.main_window = AppWindow(user_email)
+        self.main_window.show()
 
     def handle_logout(self):
         """Xử lý đăng xuất"""
@@ -198,31 +242,31 @@ class MainWindow(QMainWindow):
         return SessionManager.check_existing_session()
 
 
+def _flush_students_on_quit():
+    """Lưu dữ liệu đang chờ ghi khi thoát, nếu module student đã được nạp"""
+    student = sys.modules.get("student")
+    if student is not None:
+        student.student_manager.flush()
+
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    
+
+    # Đảm bảo dữ liệu đang chờ ghi được lưu khi thoát ứng dụng
+    app.aboutToQuit.connect(_flush_students_on_quit)
+
     # Setup application-wide icon
-    app_icon_path = os.path.join(os.path.dirname(__file__), "images", "logo.ico")
-    if os.path.exists(app_icon_path):
-        app.setWindowIcon(QIcon(app_icon_path))
+    if os.path.exists(APP_ICON_PATH):
+        app.setWindowIcon(QIcon(APP_ICON_PATH))
 
     # Kiểm tra session hiện tại
     existing_session = MainWindow.check_existing_session()
 
     if existing_session:
         # Nếu có session hợp lệ, mở trực tiếp main app
-        try:
-            widget = AppWindow(existing_session["user_email"])
-        except ImportError:
-            # Fallback to placeholder
-            from dashboard import DashboardWindow
-
-            login_widget = MainWindow()
-            login_widget.dashboard_window = DashboardWindow(
-                existing_session["user_email"]
-            )
-            login_widget.dashboard_window.show()
-            widget = login_widget.dashboard_window
+        from app import AppWindow
+
+        widget = AppWindow(existing_session["user_email"])
     else:
         # Hiển thị màn hình login
         widget = MainWindow()
@@ -3,13 +3,14 @@ Session Management Module
 Handles user session operations for Seminary Management System
 """
 
-import json
 import os
 from datetime import datetime, timedelta
 from PySide6.QtCore import QStandardPaths
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
+from json_utils import json_dumps, json_loads
+
 
 class SessionManager:
     """Manages user session operations - login, logout, session validation"""
@@ -17,12 +18,22 @@ class SessionManager:
     SESSION_FILE = "session.json"
     SESSION_DURATION_HOURS = 24
 
+    # Resolved once - the QStandardPaths lookup and makedirs only need to
+    # happen on the first call
+    _session_file_path = None
+
     @staticmethod
     def get_session_file_path():
         """Get the full path to the session file"""
-        config_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-        os.makedirs(config_dir, exist_ok=True)
-        return os.path.join(config_dir, SessionManager.SESSION_FILE)
+        if SessionManager._session_file_path is None:
+            config_dir = QStandardPaths.writableLocation(
+                QStandardPaths.AppDataLocation
+            )
+            os.makedirs(config_dir, exist_ok=True)
+            SessionManager._session_file_path = os.path.join(
+                config_dir, SessionManager.SESSION_FILE
+            )
+        return SessionManager._session_file_path
 
     @staticmethod
     def save_user_session(email: str):
@@ -43,7 +54,7 @@ class SessionManager:
 
             # Ghi session vào file
             with open(session_file, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+                f.write(json_dumps(session_data))
 
             print(f"Session saved for user: {email}")
             return True
@@ -78,8 +89,8 @@ class SessionManager:
             if not os.path.exists(session_file):
                 return None
 
-            with open(session_file, "r", encoding="utf-8") as f:
-                session_data = json.load(f)
+            with open(session_file, "rb") as f:
+                session_data = json_loads(f.read())
 
             # Kiểm tra session có hết hạn không
             expires_at = datetime.fromisoformat(session_data.get("expires_at", ""))
@@ -112,15 +123,21 @@ class SessionManager:
 
 class WindowManager:
     """Manages window navigation and lifecycle"""
-    
+
+    # Window icon shared by every window - loaded from disk once
+    _window_icon = None
+
     @staticmethod
     def setup_window_icon(window):
         """Setup window icon for any window using logo.ico"""
-        icon_path = os.path.join(os.path.dirname(__file__), "images", "logo.ico")
-        if os.path.exists(icon_path):
-            window.setWindowIcon(QIcon(icon_path))
-            return True
-        return False
+        if WindowManager._window_icon is None:
+            icon_path = os.path.join(os.path.dirname(__file__), "images", "logo.ico")
+            if not os.path.exists(icon_path):
+                return False
+            WindowManager._window_icon = QIcon(icon_path)
+
+        window.setWindowIcon(WindowManager._window_icon)
+        return True
 
     @staticmethod
     def show_login_window():
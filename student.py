@@ -3,12 +3,31 @@ Student Management Module
 Handles student data operations for Seminary Management System
 """
 
-import json
 import os
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from PySide6.QtCore import QObject, Signal
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+    ConfigDict,
+)
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from json_utils import json_dumps, json_loads
+
+
+@lru_cache(maxsize=1024)
+def _parse_birth_date(birth_date: str) -> Optional[datetime]:
+    """Parse a DD/MM/YYYY birth date, caching parses across calls"""
+    try:
+        return datetime.strptime(birth_date, "%d/%m/%Y")
+    except (ValueError, TypeError):
+        return None
 
 
 class Student(BaseModel):
@@ -42,11 +61,9 @@ class Student(BaseModel):
     @classmethod
     def validate_birth_date(cls, v):
         """Validate birth date format"""
-        try:
-            datetime.strptime(v, "%d/%m/%Y")
-            return v
-        except ValueError:
+        if _parse_birth_date(v) is None:
             raise ValueError("Birth date must be in DD/MM/YYYY format")
+        return v
 
     @field_validator("id")
     @classmethod
@@ -69,18 +86,23 @@ class Student(BaseModel):
 
     def get_age(self) -> int:
         """Calculate age from birth date"""
-        try:
-            birth_date = datetime.strptime(self.birth_date, "%d/%m/%Y")
-            today = datetime.now()
-            age = today.year - birth_date.year
-            if today.month < birth_date.month or (
-                today.month == birth_date.month and today.day < birth_date.day
-            ):
-                age -= 1
-            return age
-        except (ValueError, TypeError):
+        birth_date = _parse_birth_date(self.birth_date)
+        if birth_date is None:
             return 0
 
+        today = datetime.now()
+        # Branchless form of "subtract one before the birthday":
+        # (YYYYMMDD_today - YYYYMMDD_birth) // 10000
+        return (
+            (today.year * 10000 + today.month * 100 + today.day)
+            - (birth_date.year * 10000 + birth_date.month * 100 + birth_date.day)
+        ) // 10000
+
+
+# Validates a whole roster in one pydantic-core call instead of one
+# model_validate call per student
+_STUDENT_LIST_ADAPTER = TypeAdapter(List[Student])
+
 
 class StudentManager(QObject):
     """Manages student operations - CRUD, search, data persistence"""
@@ -91,57 +113,191 @@ class StudentManager(QObject):
     student_updated = Signal(str)  # student_id
     student_deleted = Signal(str)  # student_id
 
-    DATA_FILE = "students_data.json"
+    DATA_FILE = "students_data.jsonl"
+    LEGACY_DATA_FILE = "students_data.json"
+    SAVE_DEBOUNCE_MS = 500
+    # Compact the log once superseded records exceed this share
+    COMPACT_THRESHOLD = 0.25
 
     def __init__(self):
         super().__init__()
+        # Debounced persistence - mutations mark the data dirty and the
+        # actual disk write runs once the burst has settled
+        self._dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self.save_data)
         self.students: List[Student] = []
+        self._students_by_id: Dict[str, Student] = {}
+        self._diocese_count: Counter = Counter()
+        self._parish_count: Counter = Counter()
+        self._hometown_count: Counter = Counter()
+        self._max_id_num = 0
+        self._stale_records = 0
+        self._search_blobs: List[str] = []
+        self._diocese_lower: List[str] = []
+        self._parish_lower: List[str] = []
+        self._hometown_lower: List[str] = []
         self.load_data()
 
+    def _rebuild_index(self) -> None:
+        """Rebuild the id -> student lookup index and running statistics"""
+        self._students_by_id = {student.id: student for student in self.students}
+        self._diocese_count = Counter(s.diocese for s in self.students)
+        self._parish_count = Counter(s.parish for s in self.students)
+        self._hometown_count = Counter(s.hometown for s in self.students)
+        self._max_id_num = max(
+            (int(s.id[2:]) for s in self.students if s.id[2:].isdigit()), default=0
+        )
+        self._search_blobs = [self._search_blob(s) for s in self.students]
+        self._diocese_lower = [s.diocese.lower() for s in self.students]
+        self._parish_lower = [s.parish.lower() for s in self.students]
+        self._hometown_lower = [s.hometown.lower() for s in self.students]
+
+    @staticmethod
+    def _search_blob(student: Student) -> str:
+        """Concatenated, case-folded text a student is searched by"""
+        return "\n".join(
+            (
+                student.id,
+                student.name,
+                student.hometown,
+                student.parish,
+                student.diocese,
+            )
+        ).casefold()
+
+    def _track_id(self, student_id: str) -> None:
+        """Keep the highest numeric ID suffix seen so far"""
+        suffix = student_id[2:]
+        if suffix.isdigit():
+            self._max_id_num = max(self._max_id_num, int(suffix))
+
+    def _count_student(self, student: Student, delta: int) -> None:
+        """Adjust the running distribution counters for one student"""
+        for counter, key in (
+            (self._diocese_count, student.diocese),
+            (self._parish_count, student.parish),
+            (self._hometown_count, student.hometown),
+        ):
+            counter[key] += delta
+            if counter[key] <= 0:
+                del counter[key]
+
     def get_data_file_path(self) -> str:
         """Get the full path to the data file"""
         return os.path.join(os.path.dirname(__file__), self.DATA_FILE)
 
     def load_data(self) -> bool:
-        """Load students data from JSON file"""
-        try:
-            data_file = self.get_data_file_path()
-
-            if not os.path.exists(data_file):
-                # Create sample data if file doesn't exist
-                self.create_sample_data()
-                return True
+        """Load students data by replaying the JSONL log"""
+        data_file = self.get_data_file_path()
 
-            with open(data_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            self.students = [
-                Student.from_dict(student_data)
-                for student_data in data.get("students", [])
-            ]
-            print(f"Loaded {len(self.students)} students from file")
+        if not os.path.exists(data_file):
+            legacy_file = os.path.join(
+                os.path.dirname(__file__), self.LEGACY_DATA_FILE
+            )
+            if os.path.exists(legacy_file):
+                try:
+                    # One-time migration from the single-document format
+                    return self._load_legacy_file(legacy_file)
+                except Exception as e:
+                    # Never overwrite an existing data file with samples
+                    print(f"Error loading students data: {e}")
+                    return False
+            # Create sample data only when no data file exists at all
+            self.create_sample_data()
             return True
 
+        try:
+            # Read the whole log as raw bytes - the JSON parsers accept
+            # UTF-8 bytes directly, so no separate text decode pass
+            with open(data_file, "rb") as f:
+                raw = f.read()
         except Exception as e:
             print(f"Error loading students data: {e}")
-            # Create sample data as fallback
-            self.create_sample_data()
             return False
 
+        # Replay the log: later records supersede earlier ones, and
+        # {"_op": "del"} tombstones drop a student again. Lines that fail
+        # to parse - typically a torn trailing append after a crash - are
+        # skipped so one bad line never costs the rest of the roster
+        records: Dict[str, Any] = {}
+        stale = 0
+        corrupt = 0
+        for line in raw.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json_loads(line)
+            except ValueError:
+                corrupt += 1
+                continue
+            if not isinstance(record, dict):
+                # Valid JSON but not a record (e.g. a bare number)
+                corrupt += 1
+                continue
+            if record.get("_op") == "del":
+                records.pop(record.get("id"), None)
+                stale += 1
+            elif "id" in record:
+                if record["id"] in records:
+                    stale += 1
+                records[record["id"]] = record
+            else:
+                corrupt += 1
+
+        try:
+            self.students = _STUDENT_LIST_ADAPTER.validate_python(
+                list(records.values())
+            )
+        except ValidationError:
+            # Salvage every record that validates on its own
+            self.students = []
+            for record in records.values():
+                try:
+                    self.students.append(Student.from_dict(record))
+                except ValidationError:
+                    corrupt += 1
+
+        self._rebuild_index()
+        self._stale_records = stale
+
+        if corrupt:
+            # Rewrite a clean log so the damage is not replayed again
+            print(f"Skipped {corrupt} corrupt records in {self.DATA_FILE}")
+            self.save_data()
+
+        print(f"Loaded {len(self.students)} students from file")
+        return True
+
+    def _load_legacy_file(self, legacy_file: str) -> bool:
+        """Load the old single-document JSON file and rewrite it as JSONL"""
+        with open(legacy_file, "rb") as f:
+            data = json_loads(f.read())
+
+        self.students = _STUDENT_LIST_ADAPTER.validate_python(data.get("students", []))
+        self._rebuild_index()
+        self.save_data()
+        print(f"Migrated {len(self.students)} students to {self.DATA_FILE}")
+        return True
+
     def save_data(self) -> bool:
-        """Save students data to JSON file"""
+        """Rewrite the JSONL log with one record per student (compaction)"""
         try:
             data_file = self.get_data_file_path()
+            tmp_file = data_file + ".tmp"
 
-            data = {
-                "students": [student.to_dict() for student in self.students],
-                "last_updated": datetime.now().isoformat(),
-                "total_count": len(self.students),
-            }
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                for student in self.students:
+                    f.write(json_dumps(student.to_dict()) + "\n")
 
-            with open(data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Atomic swap - a crash mid-write never leaves a truncated log
+            os.replace(tmp_file, data_file)
 
+            self._dirty = False
+            self._stale_records = 0
             print(f"Saved {len(self.students)} students to file")
             return True
 
@@ -149,6 +305,33 @@ class StudentManager(QObject):
             print(f"Error saving students data: {e}")
             return False
 
+    def _append_record(self, record: Dict[str, Any]) -> None:
+        """Append one log record - O(1) instead of rewriting the file"""
+        try:
+            with open(self.get_data_file_path(), "a", encoding="utf-8") as f:
+                f.write(json_dumps(record) + "\n")
+        except Exception as e:
+            print(f"Error appending record: {e}")
+            self._schedule_save()
+
+    def _mark_stale(self) -> None:
+        """Track superseded log records and compact once they pile up"""
+        self._stale_records += 1
+        if self._stale_records > max(8, len(self.students) * self.COMPACT_THRESHOLD):
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Mark the data dirty and debounce the disk write"""
+        self._dirty = True
+        self._save_timer.start()
+
+    def flush(self) -> bool:
+        """Write any pending changes immediately"""
+        self._save_timer.stop()
+        if self._dirty:
+            return self.save_data()
+        return True
+
     def create_sample_data(self) -> None:
         """Create sample student data"""
         sample_students = [
@@ -235,6 +418,7 @@ class StudentManager(QObject):
         ]
 
         self.students = sample_students
+        self._rebuild_index()
         self.save_data()
         print(f"Created {len(sample_students)} sample students")
 
@@ -245,10 +429,7 @@ class StudentManager(QObject):
 
     def get_student_by_id(self, student_id: str) -> Optional[Student]:
         """Get student by ID"""
-        for student in self.students:
-            if student.id == student_id:
-                return student
-        return None
+        return self._students_by_id.get(student_id)
 
     def add_student(self, student: Student) -> bool:
         """Add new student"""
@@ -259,7 +440,14 @@ class StudentManager(QObject):
                 return False
 
             self.students.append(student)
-            self.save_data()
+            self._search_blobs.append(self._search_blob(student))
+            self._diocese_lower.append(student.diocese.lower())
+            self._parish_lower.append(student.parish.lower())
+            self._hometown_lower.append(student.hometown.lower())
+            self._students_by_id[student.id] = student
+            self._count_student(student, +1)
+            self._track_id(student.id)
+            self._append_record(student.to_dict())
             self.student_added.emit(student.id)
             self.students_changed.emit()
             print(f"Added student: {student.name}")
@@ -272,17 +460,30 @@ class StudentManager(QObject):
     def update_student(self, student_id: str, updated_student: Student) -> bool:
         """Update existing student"""
         try:
-            for i, student in enumerate(self.students):
-                if student.id == student_id:
-                    self.students[i] = updated_student
-                    self.save_data()
-                    self.student_updated.emit(student_id)
-                    self.students_changed.emit()
-                    print(f"Updated student: {updated_student.name}")
-                    return True
-
-            print(f"Student with ID {student_id} not found")
-            return False
+            student = self._students_by_id.get(student_id)
+            if student is None:
+                print(f"Student with ID {student_id} not found")
+                return False
+
+            i = self.students.index(student)
+            self.students[i] = updated_student
+            self._search_blobs[i] = self._search_blob(updated_student)
+            self._diocese_lower[i] = updated_student.diocese.lower()
+            self._parish_lower[i] = updated_student.parish.lower()
+            self._hometown_lower[i] = updated_student.hometown.lower()
+            self._students_by_id.pop(student_id, None)
+            self._students_by_id[updated_student.id] = updated_student
+            self._count_student(student, -1)
+            self._count_student(updated_student, +1)
+            self._track_id(updated_student.id)
+            if updated_student.id != student_id:
+                self._append_record({"_op": "del", "id": student_id})
+            self._append_record(updated_student.to_dict())
+            self._mark_stale()
+            self.student_updated.emit(student_id)
+            self.students_changed.emit()
+            print(f"Updated student: {updated_student.name}")
+            return True
 
         except Exception as e:
             print(f"Error updating student: {e}")
@@ -291,17 +492,24 @@ class StudentManager(QObject):
     def delete_student(self, student_id: str) -> bool:
         """Delete student by ID"""
         try:
-            for i, student in enumerate(self.students):
-                if student.id == student_id:
-                    deleted_student = self.students.pop(i)
-                    self.save_data()
-                    self.student_deleted.emit(student_id)
-                    self.students_changed.emit()
-                    print(f"Deleted student: {deleted_student.name}")
-                    return True
-
-            print(f"Student with ID {student_id} not found")
-            return False
+            deleted_student = self._students_by_id.pop(student_id, None)
+            if deleted_student is None:
+                print(f"Student with ID {student_id} not found")
+                return False
+
+            i = self.students.index(deleted_student)
+            self.students.pop(i)
+            self._search_blobs.pop(i)
+            self._diocese_lower.pop(i)
+            self._parish_lower.pop(i)
+            self._hometown_lower.pop(i)
+            self._count_student(deleted_student, -1)
+            self._append_record({"_op": "del", "id": student_id})
+            self._mark_stale()
+            self.student_deleted.emit(student_id)
+            self.students_changed.emit()
+            print(f"Deleted student: {deleted_student.name}")
+            return True
 
         except Exception as e:
             print(f"Error deleting student: {e}")
@@ -310,46 +518,42 @@ class StudentManager(QObject):
     # Search and Filter Operations
     def search_students(self, query: str) -> List[Student]:
         """Search students by name, ID, hometown, parish, or diocese"""
-        if not query.strip():
+        query = query.strip().casefold()
+        if not query:
             return self.get_all_students()
 
-        query = query.lower().strip()
-        results = []
-
-        for student in self.students:
-            if (
-                query in student.id.lower()
-                or query in student.name.lower()
-                or query in student.hometown.lower()
-                or query in student.parish.lower()
-                or query in student.diocese.lower()
-            ):
-                results.append(student)
-
-        return results
+        # One substring test per student against the pre-folded blob
+        return [
+            student
+            for student, blob in zip(self.students, self._search_blobs)
+            if query in blob
+        ]
 
     def filter_by_diocese(self, diocese: str) -> List[Student]:
         """Filter students by diocese"""
+        diocese = diocese.lower()
         return [
             student
-            for student in self.students
-            if student.diocese.lower() == diocese.lower()
+            for student, value in zip(self.students, self._diocese_lower)
+            if value == diocese
         ]
 
     def filter_by_parish(self, parish: str) -> List[Student]:
         """Filter students by parish"""
+        parish = parish.lower()
         return [
             student
-            for student in self.students
-            if student.parish.lower() == parish.lower()
+            for student, value in zip(self.students, self._parish_lower)
+            if value == parish
         ]
 
     def filter_by_hometown(self, hometown: str) -> List[Student]:
         """Filter students by hometown"""
+        hometown = hometown.lower()
         return [
             student
-            for student in self.students
-            if student.hometown.lower() == hometown.lower()
+            for student, value in zip(self.students, self._hometown_lower)
+            if value == hometown
         ]
 
     # Statistics and Utility Methods
@@ -359,46 +563,20 @@ class StudentManager(QObject):
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get student statistics"""
-        total = len(self.students)
-
-        # Count by diocese
-        diocese_count = {}
-        parish_count = {}
-        hometown_count = {}
-
-        for student in self.students:
-            diocese_count[student.diocese] = diocese_count.get(student.diocese, 0) + 1
-            parish_count[student.parish] = parish_count.get(student.parish, 0) + 1
-            hometown_count[student.hometown] = (
-                hometown_count.get(student.hometown, 0) + 1
-            )
-
+        # Served from the running counters - no pass over the students
         return {
-            "total_students": total,
-            "diocese_distribution": diocese_count,
-            "parish_distribution": parish_count,
-            "hometown_distribution": hometown_count,
-            "unique_dioceses": len(diocese_count),
-            "unique_parishes": len(parish_count),
-            "unique_hometowns": len(hometown_count),
+            "total_students": len(self.students),
+            "diocese_distribution": dict(self._diocese_count),
+            "parish_distribution": dict(self._parish_count),
+            "hometown_distribution": dict(self._hometown_count),
+            "unique_dioceses": len(self._diocese_count),
+            "unique_parishes": len(self._parish_count),
+            "unique_hometowns": len(self._hometown_count),
         }
 
     def generate_next_id(self) -> str:
         """Generate next student ID"""
-        if not self.students:
-            return "SV001"
-
-        # Find the highest ID number
-        max_num = 0
-        for student in self.students:
-            if student.id.startswith("SV"):
-                try:
-                    num = int(student.id[2:])
-                    max_num = max(max_num, num)
-                except (ValueError, IndexError):
-                    continue
-
-        return f"SV{(max_num + 1):03d}"
+        return f"SV{(self._max_id_num + 1):03d}"
 
     def export_to_csv(self, file_path: str) -> bool:
         """Export students data to CSV file"""
@@ -418,18 +596,20 @@ class StudentManager(QObject):
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
 
                 writer.writeheader()
-                for student in self.students:
-                    writer.writerow(
-                        {
-                            "ID": student.id,
-                            "Tên": student.name,
-                            "Ngày Sinh": student.birth_date,
-                            "Tuổi": student.get_age(),
-                            "Quê Quán": student.hometown,
-                            "Giao Xứ": student.parish,
-                            "Giáo Phận": student.diocese,
-                        }
-                    )
+                # One writerows call streaming a generator - rows never
+                # accumulate in a Python-level loop of writerow calls
+                writer.writerows(
+                    {
+                        "ID": student.id,
+                        "Tên": student.name,
+                        "Ngày Sinh": student.birth_date,
+                        "Tuổi": student.get_age(),
+                        "Quê Quán": student.hometown,
+                        "Giao Xứ": student.parish,
+                        "Giáo Phận": student.diocese,
+                    }
+                    for student in self.students
+                )
 
             print(f"Exported {len(self.students)} students to {file_path}")
             return True